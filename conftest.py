@@ -0,0 +1,6 @@
+"""Root conftest.
+
+Its presence makes pytest put the repository root on sys.path, so tests
+import the ``verification`` package directly instead of each prepending
+``verification/python`` to sys.path at import time.
+"""
@@ -1,6 +1,25 @@
 """Verification module for pattern validation.
 
 This module contains verification functions organized by language/platform.
+
+The Python implementations are re-exported at the top level so tests and
+callers can import them from the package without sys.path manipulation.
+Re-export is lazy (PEP 562): the implementation module is only imported
+on first attribute access.
 """
 
+import importlib
+
 __all__ = ["python"]
+
+
+def __getattr__(name):
+    module = importlib.import_module(".python.verification", __name__)
+    try:
+        value = getattr(module, name)
+    except AttributeError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+    globals()[name] = value  # cache so __getattr__ runs once per name
+    return value
@@ -2,25 +2,13 @@
 
 This module contains reusable verification functions that can be imported
 and used in different pattern detection implementations.
+
+The names in ``__all__`` are loaded lazily (PEP 562): ``verification.py``
+and its compiled regexes/lookup tables are only imported on the first
+attribute access, so consumers that never call a verifier pay nothing.
 """
 
-from .verification import (
-    VERIFICATION_FUNCTIONS,
-    contains_letter,
-    dms_coordinate,
-    generic_number_not_timestamp,
-    get_verification_function,
-    high_entropy_token,
-    iban_mod97,
-    korean_bank_account_valid,
-    korean_zipcode_valid,
-    luhn,
-    not_timestamp,
-    register_verification_function,
-    unregister_verification_function,
-    us_ssn_valid,
-    us_zipcode_valid,
-)
+import importlib
 
 __all__ = [
     "VERIFICATION_FUNCTIONS",
@@ -33,9 +21,20 @@ __all__ = [
     "korean_bank_account_valid",
     "korean_zipcode_valid",
     "luhn",
+    "luhn_batch",
     "not_timestamp",
     "register_verification_function",
     "unregister_verification_function",
     "us_ssn_valid",
     "us_zipcode_valid",
+    "verify_batch",
 ]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(".verification", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so __getattr__ runs once per name
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -10,14 +10,97 @@ All verification functions follow the signature: (str) -> bool
 import logging
 import math
 import os
+import re
+import sys
+from bisect import bisect_right
 from collections import Counter
+from functools import lru_cache
+from operator import mul
 from pathlib import Path
-from typing import Callable, Dict, Optional, Set
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional
 
 logger = logging.getLogger(__name__)
 
 # Cache for data-driven verification
-_DATA_CACHE: Dict[str, Set[str]] = {}
+_DATA_CACHE: Dict[str, FrozenSet[str]] = {}
+
+# Precompiled patterns. Compiling at import keeps validator calls off
+# re's internal pattern cache (512 entries, evictable under load) and
+# lets them use the bound .match directly. re.ASCII pins \d/\s and the
+# IGNORECASE folding to ASCII semantics, skipping Unicode table lookups.
+_DMS_LAT_RE: re.Pattern = re.compile(
+    r"(?:0?90|0?[0-8]?\d)°\s*[0-5]?\d′\s*[0-5]?\d(?:\.\d+)?″\s*[NS]",
+    re.IGNORECASE | re.ASCII,
+)
+_DMS_LON_RE: re.Pattern = re.compile(
+    r"(?:180|1[0-7]\d|0?\d{1,2})°\s*[0-5]?\d′\s*[0-5]?\d(?:\.\d+)?″\s*[EW]",
+    re.IGNORECASE | re.ASCII,
+)
+
+_NON_DIGITS_RE: re.Pattern = re.compile(r"\D+", re.ASCII)
+
+# Any character outside the CJK name ranges (Hiragana/Katakana, CJK
+# Unified Ideographs, Hangul); used as a negated single-scan check.
+_NON_CJK_RE: re.Pattern = re.compile(
+    r"[^\u3040-\u30ff\u4e00-\u9fff\uac00-\ud7af]"
+)
+
+
+def _weighted_digit_sum(digits: str, weights: tuple) -> int:
+    """
+    Dot product of a digit string with a weight tuple.
+
+    Multiplies raw byte values through one C-level map(mul) pass and
+    removes the ASCII-zero bias afterwards, avoiding an int() call per
+    digit. The caller must supply at least len(weights) digit
+    characters; extra digits are ignored.
+    """
+    return sum(map(mul, digits.encode(), weights)) - 48 * sum(weights)
+
+
+def _parse_yymmdd(digits: str):
+    """
+    Parse the leading YYMMDD pairs of a pre-stripped digit string.
+
+    Returns (yy, mm, dd) assembled from byte values in one pass; the
+    caller must guarantee at least six digit characters, which makes
+    the per-caller int() slices and their ValueError guards redundant.
+    """
+    b = digits.encode()
+    return (
+        (b[0] - 48) * 10 + b[1] - 48,
+        (b[2] - 48) * 10 + b[3] - 48,
+        (b[4] - 48) * 10 + b[5] - 48,
+    )
+
+
+def _all_same(digits: str) -> bool:
+    """
+    True if every character of digits is the same (e.g. "00000").
+
+    A single C-level string compare instead of building a set just to
+    count its distinct characters.
+    """
+    return digits == digits[:1] * len(digits)
+
+
+@lru_cache(maxsize=4096)
+def _strip_non_digits(value: str) -> str:
+    """
+    Return only the digit characters of value.
+
+    Strips separators in one C-level regex pass instead of a
+    per-character join filter, with a no-copy fast path for the common
+    all-ASCII-digit input. The isascii() guard keeps the fast path in
+    agreement with the re.ASCII regex: non-ASCII digits are stripped,
+    never returned, so callers can rely on one byte per digit. Cached so
+    the several timestamp/account verifiers that the registry may run on
+    the same candidate strip it only once.
+    """
+    if value.isascii() and value.isdigit():
+        return value
+    return _NON_DIGITS_RE.sub("", value)
 
 
 def _get_data_path() -> Path:
@@ -27,32 +110,56 @@ def _get_data_path() -> Path:
     return Path(__file__).parent.parent.parent / "datas"
 
 
-def _load_data_file(filename: str) -> Set[str]:
+def _load_data_file(filename: str) -> FrozenSet[str]:
     """Load values from a CSV data file."""
     if filename in _DATA_CACHE:
         return _DATA_CACHE[filename]
 
     data_path = _get_data_path() / filename
-    values = set()
+    values = frozenset()
 
     if data_path.exists():
         try:
-            with open(data_path, "r", encoding="utf-8") as f:
-                # Skip header
-                lines = f.readlines()
-                if len(lines) > 1:
-                    for line in lines[1:]:
-                        val = line.strip()
-                        if val:
-                            values.add(val)
-            logger.info(f"Loaded {len(values)} entries from {filename}")
+            # One-shot read and a C-level set build; [1:] skips the header
+            lines = data_path.read_text(encoding="utf-8").splitlines()[1:]
+            values = frozenset({line.strip() for line in lines} - {""})
+            logger.info("Loaded %d entries from %s", len(values), filename)
         except Exception as e:
-            logger.error(f"Failed to load data file {filename}: {e}")
+            logger.error("Failed to load data file %s: %s", filename, e)
 
     _DATA_CACHE[filename] = values
     return values
 
 
+# Letter-to-digits table for IBAN expansion (A=10, B=11, ..., Z=35),
+# applied with str.translate so the expansion runs in one C-level pass.
+_IBAN_TRANS = str.maketrans({chr(ord("A") + i): str(10 + i) for i in range(26)})
+
+# Combined space-strip + ASCII uppercase table: replaces the two-pass
+# replace-then-upper idiom with a single str.translate scan.
+# Non-ASCII letters stay untouched, which is fine for validators that
+# only accept ASCII formats anyway.
+_UPPER_NO_SPACE = str.maketrans(
+    "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ", " "
+)
+
+
+def _mod97(digits: str) -> int:
+    """
+    Mod-97 of a decimal string, streamed nine digits at a time.
+
+    Folding fixed-width chunks keeps the accumulator in machine-word
+    range instead of parsing the whole string into one big int. The
+    caller must pass a digit-only string.
+    """
+    acc = 0
+    for i in range(0, len(digits), 9):
+        chunk = digits[i:i + 9]
+        acc = (acc * 10 ** len(chunk) + int(chunk)) % 97
+    return acc
+
+
+@lru_cache(maxsize=4096)
 def iban_mod97(value: str) -> bool:
     """
     Verify IBAN using Mod-97 check algorithm.
@@ -69,32 +176,34 @@ def iban_mod97(value: str) -> bool:
     Returns:
         True if IBAN passes mod-97 verification, False otherwise
     """
-    # Remove spaces and convert to uppercase
-    iban = value.replace(" ", "").upper()
+    # Strip spaces and uppercase in one translate pass
+    iban = value.translate(_UPPER_NO_SPACE)
 
     # Move first 4 chars to end
     rearranged = iban[4:] + iban[:4]
 
-    # Replace letters with numbers (A=10, B=11, ..., Z=35)
-    numeric_string = ""
-    for char in rearranged:
-        if char.isdigit():
-            numeric_string += char
-        elif char.isalpha():
-            # A=10, B=11, ..., Z=35
-            numeric_string += str(ord(char) - ord("A") + 10)
-        else:
-            # Invalid character
-            return False
+    # Expand letters in a single translate call; any character that is
+    # neither a digit nor A-Z survives untouched and fails the digit check.
+    numeric_string = rearranged.translate(_IBAN_TRANS)
 
-    # Calculate mod 97
-    try:
-        remainder = int(numeric_string) % 97
-        return remainder == 1
-    except (ValueError, OverflowError):
+    if not numeric_string.isdigit():
         return False
 
+    return _mod97(numeric_string) == 1
+
 
+# Luhn tables indexed by ASCII byte: _LUHN_PLAIN gives the digit value,
+# _LUHN_DOUBLED gives 2*d - 9 if 2*d > 9 else 2*d, so the "double then
+# subtract 9" branch becomes a table read. _LUHN_NON_DIGITS is the
+# delete argument for bytes.translate, stripping separators in C.
+_LUHN_PLAIN = bytes(i - 48 if 48 <= i <= 57 else 0 for i in range(256))
+_LUHN_DOUBLED = bytes(
+    (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)[i - 48] if 48 <= i <= 57 else 0 for i in range(256)
+)
+_LUHN_NON_DIGITS = bytes(i for i in range(256) if not 48 <= i <= 57)
+
+
+@lru_cache(maxsize=4096)
 def luhn(value: str) -> bool:
     """
     Verify using Luhn algorithm (mod-10 checksum).
@@ -107,26 +216,21 @@ def luhn(value: str) -> bool:
     Returns:
         True if passes Luhn check, False otherwise
     """
-    # Remove non-digits
-    digits = [int(d) for d in value if d.isdigit()]
-
+    # Strip non-digits with one C-level translate, then sum a single
+    # right-to-left pass of byte-indexed table reads - no per-digit
+    # int() calls and no branch on every second digit.
+    digits = value.encode("ascii", "ignore").translate(None, _LUHN_NON_DIGITS)
     if not digits:
         return False
 
-    # Luhn algorithm
     checksum = 0
-    reverse_digits = digits[::-1]
-
-    for i, digit in enumerate(reverse_digits):
-        if i % 2 == 1:  # Every second digit from right
-            digit *= 2
-            if digit > 9:
-                digit -= 9
-        checksum += digit
+    for i, byte in enumerate(reversed(digits)):
+        checksum += _LUHN_DOUBLED[byte] if i & 1 else _LUHN_PLAIN[byte]
 
     return checksum % 10 == 0
 
 
+@lru_cache(maxsize=4096)
 def dms_coordinate(value: str) -> bool:
     """
     Verify DMS (Degrees Minutes Seconds) coordinate format.
@@ -143,34 +247,36 @@ def dms_coordinate(value: str) -> bool:
     Returns:
         True if valid DMS coordinate, False otherwise
     """
-    import re
-
-    # Parse DMS format
-    pattern = r"(\d{1,3})°\s*(\d{1,2})′\s*(\d{1,2}(?:\.\d+)?)″\s*([NSEW])"
-    match = re.match(pattern, value, re.IGNORECASE)
-    if not match:
+    # Fast reject before touching the regex engine: every DMS string
+    # starts with a digit, and most scan candidates do not.
+    if not value or not "0" <= value[0] <= "9":
         return False
 
-    degrees = int(match.group(1))
-    minutes = int(match.group(2))
-    seconds = float(match.group(3))
-    direction = match.group(4).upper()
+    # The degree/minute/second ranges are baked into the patterns, so
+    # out-of-range coordinates are rejected inside the C regex engine
+    # with no component parsing or Python-level comparisons.
+    return bool(_DMS_LAT_RE.match(value) or _DMS_LON_RE.match(value))
 
-    # Validate minutes and seconds
-    if minutes > 59 or seconds >= 60:
-        return False
 
-    # Validate degrees based on direction
-    if direction in ("N", "S"):  # Latitude
-        if degrees > 90:
-            return False
-    elif direction in ("E", "W"):  # Longitude
-        if degrees > 180:
-            return False
+# Token alphabet for high_entropy_token, built once at import time.
+# Allowed token bytes, used as a bytes.translate deletion set: deleting
+# every allowed byte from a candidate leaves b"" iff the token is clean.
+_TOKEN_ALLOWED_BYTES = (
+    b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-+/.="
+)
 
-    return True
+# n * log2(n) for small counts, so the entropy sum avoids a math.log2
+# call per distinct character for typical token lengths.
+_NLOGN = tuple(n * math.log2(n) if n else 0.0 for n in range(256))
+
+# Entropy threshold and the matching unique-character lower bound:
+# H <= log2(unique chars), so fewer than 2**threshold distinct chars
+# can never reach the threshold and is rejected without the log sum.
+_MIN_TOKEN_ENTROPY = 4.0
+_MIN_UNIQUE_CHARS = 2 ** int(_MIN_TOKEN_ENTROPY)  # 16
 
 
+@lru_cache(maxsize=4096)
 def high_entropy_token(value: str) -> bool:
     """
     Verify token has high entropy characteristics.
@@ -190,33 +296,57 @@ def high_entropy_token(value: str) -> bool:
         True if token has high entropy characteristics, False otherwise
     """
     # Check minimum length
-    if len(value) < 20:
+    length = len(value)
+    if length < 20:
         return False
 
-    # Check for spaces or line breaks
-    if any(c in value for c in " \n\r\t"):
+    # Check character set (base64url: A-Za-z0-9_- or hex: A-Fa-f0-9)
+    # Being permissive to catch various token formats including JWT (with dots).
+    # Whitespace is not in the set, so this also rejects spaces/line breaks.
+    # encode() length-checks for non-ASCII; translate deletes every
+    # allowed byte, so anything surviving the pass is an invalid char.
+    encoded = value.encode("ascii", "ignore")
+    if len(encoded) != length or encoded.translate(None, _TOKEN_ALLOWED_BYTES):
         return False
 
-    # Check character set (base64url: A-Za-z0-9_- or hex: A-Fa-f0-9)
-    # Being permissive to catch various token formats including JWT (with dots)
-    allowed_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789_-+/.=")
-    if not all(c in allowed_chars for c in value):
+    # Entropy is bounded by log2 of the distinct-character count, so a
+    # token with too few unique characters is rejected before the sum.
+    char_counts = Counter(encoded)
+    if len(char_counts) < _MIN_UNIQUE_CHARS:
         return False
 
-    # Calculate Shannon entropy
-    char_counts = Counter(value)
-    length = len(value)
-    entropy = -sum((count / length) * math.log2(count / length) for count in char_counts.values())
+    # Calculate Shannon entropy as log2(L) - sum(c*log2(c))/L, reading
+    # c*log2(c) from the precomputed table for typical token counts.
+    nlogn_sum = sum(
+        _NLOGN[count] if count < 256 else count * math.log2(count)
+        for count in char_counts.values()
+    )
+    entropy = math.log2(length) - nlogn_sum / length
 
     # High entropy threshold
     # Base64: theoretical max ~6 bits/char, practical ~5-5.5 for random data
     # Hex: theoretical max ~4 bits/char, practical ~3.5-4 for random data
-    # Set threshold at 4.0 to catch both formats while filtering repetitive strings
-    min_entropy = 4.0
+    # Threshold 4.0 catches both formats while filtering repetitive strings
+    return entropy >= _MIN_TOKEN_ENTROPY
+
 
-    return entropy >= min_entropy
+def _looks_like_yyyymmdd(digits: str) -> bool:
+    """
+    True if the first 8 characters of a digit string read as a
+    plausible YYYYMMDD date (year 1900-2099).
 
+    Shared by the timestamp detectors so the compact-datetime check is
+    written once instead of per caller. Fields are assembled from byte
+    values in one pass rather than three int(slice) parses.
+    """
+    b = digits.encode()
+    year = (b[0] - 48) * 1000 + (b[1] - 48) * 100 + (b[2] - 48) * 10 + b[3] - 48
+    month = (b[4] - 48) * 10 + b[5] - 48
+    day = (b[6] - 48) * 10 + b[7] - 48
+    return 1900 <= year <= 2099 and 1 <= month <= 12 and 1 <= day <= 31
 
+
+@lru_cache(maxsize=4096)
 def not_timestamp(value: str) -> bool:
     """
     Verify that a numeric string is NOT a timestamp.
@@ -233,106 +363,122 @@ def not_timestamp(value: str) -> bool:
         True if NOT a timestamp (safe to classify as PII), False if looks like timestamp
     """
     # Remove common separators to get just digits
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if not digits_only:
         return True
 
     length = len(digits_only)
 
-    # 10-digit Unix timestamp range check (2001-2286)
+    # 10-digit Unix timestamp range check (2001-2286).
+    # Every 10-digit number not starting with 0 falls in the timestamp
+    # range 1000000000 (Sep 2001) to 9999999999 (Nov 2286), so a leading
+    # digit check replaces the int() parse.
     if length == 10:
-        try:
-            num = int(digits_only)
-            # Unix timestamp range: 1000000000 (Sep 2001) to 9999999999 (Nov 2286)
-            if 1000000000 <= num <= 9999999999:
-                return False  # Likely a timestamp
-        except ValueError:
-            pass
-
-    # 13-digit Unix timestamp in milliseconds (2001-2286)
+        return digits_only[0] == "0"
+
+    # 13-digit Unix timestamp in milliseconds (2001-2286); same leading
+    # digit argument for the 1000000000000-9999999999999 range.
     if length == 13:
-        try:
-            num = int(digits_only)
-            # Unix timestamp ms range: 1000000000000 to 9999999999999
-            if 1000000000000 <= num <= 9999999999999:
-                return False  # Likely a timestamp in ms
-        except ValueError:
-            pass
+        return digits_only[0] == "0"
 
     # 14-digit compact datetime (YYYYMMDDHHMMSS)
-    if length == 14:
-        # Check if it looks like a date: YYYY (19xx or 20xx), MM (01-12), DD (01-31)
-        try:
-            year = int(digits_only[:4])
-            month = int(digits_only[4:6])
-            day = int(digits_only[6:8])
-            hour = int(digits_only[8:10])
-            minute = int(digits_only[10:12])
-            second = int(digits_only[12:14])
-
-            # Check if components are in valid ranges
-            if (
-                1900 <= year <= 2099
-                and 1 <= month <= 12
-                and 1 <= day <= 31
-                and 0 <= hour <= 23
-                and 0 <= minute <= 59
-                and 0 <= second <= 59
-            ):
-                return False  # Likely a compact datetime
-        except (ValueError, IndexError):
-            pass
+    if length == 14 and _looks_like_yyyymmdd(digits_only):
+        b = digits_only.encode()
+        hour = (b[8] - 48) * 10 + b[9] - 48
+        minute = (b[10] - 48) * 10 + b[11] - 48
+        second = (b[12] - 48) * 10 + b[13] - 48
+
+        if hour <= 23 and minute <= 59 and second <= 59:
+            return False  # Likely a compact datetime
 
     # Not a recognized timestamp format
     return True
 
 
+def _is_monotone_step1(digits: str) -> bool:
+    """
+    True if consecutive digits all step by +1 or all by -1.
+
+    A step-1 run can never be longer than ten digits, so the check
+    reduces to one C-level substring search in each direction.
+    """
+    return len(digits) <= 10 and (
+        digits in "0123456789" or digits in "9876543210"
+    )
+
+
+# Zipcode CSV sets, resolved once into module globals so the validators
+# skip the per-call _DATA_CACHE lookup and Path construction.
+_KR_ZIPS: Optional[FrozenSet[str]] = None
+_US_ZIPS: Optional[FrozenSet[str]] = None
+
+
+def _kr_zips() -> FrozenSet[str]:
+    """kr_zipcodes.csv entries, loaded lazily on first use."""
+    global _KR_ZIPS
+    if _KR_ZIPS is None:
+        _KR_ZIPS = _load_data_file("kr_zipcodes.csv")
+    return _KR_ZIPS
+
+
+def _us_zips() -> FrozenSet[str]:
+    """us_zipcodes.csv entries, loaded lazily on first use."""
+    global _US_ZIPS
+    if _US_ZIPS is None:
+        _US_ZIPS = _load_data_file("us_zipcodes.csv")
+    return _US_ZIPS
+
+
+def _build_zip5_bitset() -> bytes:
+    """
+    Precompute a 12.5 KB bitset over all 5-digit codes for the zipcode
+    heuristics: bit n is set unless n is sequential (01234..56789 or
+    98765..43210), all one digit, or a multiple of 10000.
+
+    The invalid codes are a fixed set of 30, so they are enumerated
+    directly rather than testing all 100000 candidates at import time.
+    """
+    bitset = bytearray(b"\xff" * 12500)
+    invalid = {n * 11111 for n in range(10)}  # all same digit
+    invalid.update(n * 10000 for n in range(10))  # too round
+    invalid.update(int("0123456789"[i : i + 5]) for i in range(6))  # ascending
+    invalid.update(int("9876543210"[i : i + 5]) for i in range(6))  # descending
+    for n in invalid:
+        bitset[n >> 3] &= ~(1 << (n & 7))
+    return bytes(bitset)
+
+
+_ZIP5_BITSET = _build_zip5_bitset()
+
+
+@lru_cache(maxsize=4096)
 def korean_zipcode_valid(value: str) -> bool:
     """
     Verify Korean postal code is valid.
-    
+
     Checks against kr_zipcodes.csv if available, otherwise uses heuristics.
     """
     # 1. Data-driven check if data exists
-    valid_zips = _load_data_file("kr_zipcodes.csv")
+    valid_zips = _kr_zips()
     if valid_zips:
-        return value in valid_zips or value.replace("-", "") in valid_zips
+        if value in valid_zips:
+            return True
+        return "-" in value and value.replace("-", "") in valid_zips
 
     # 2. Heuristic fallback
     # Remove any separators
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if len(digits_only) != 5:
         return False
 
-    # Reject sequential patterns (12345, 54321, etc.)
-    is_sequential_up = all(
-        int(digits_only[i]) == int(digits_only[i - 1]) + 1 for i in range(1, len(digits_only))
-    )
-    is_sequential_down = all(
-        int(digits_only[i]) == int(digits_only[i - 1]) - 1 for i in range(1, len(digits_only))
-    )
-
-    if is_sequential_up or is_sequential_down:
-        return False
-
-    # Reject all same digit (00000, 11111, etc.)
-    if len(set(digits_only)) == 1:
-        return False
-
-    # Reject numbers that are too round (multiples of 10000, like 50000, 60000)
-    try:
-        num = int(digits_only)
-        if num % 10000 == 0:
-            return False
-    except ValueError:
-        return False
-
-    # Accept as likely valid postal code
-    return True
+    # Single bitset probe covers the sequential / all-same / too-round rules
+    num = int(digits_only)
+    return bool((_ZIP5_BITSET[num >> 3] >> (num & 7)) & 1)
 
 
+@lru_cache(maxsize=4096)
 def us_zipcode_valid(value: str) -> bool:
     """
     Verify US postal code is valid.
@@ -340,10 +486,10 @@ def us_zipcode_valid(value: str) -> bool:
     Checks against us_zipcodes.csv if available, otherwise uses heuristics.
     """
     # Remove any separators to get raw digits first
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
     
     # 1. Data-driven check if data exists
-    valid_zips = _load_data_file("us_zipcodes.csv")
+    valid_zips = _us_zips()
     if valid_zips:
         # If we have 5 digits, check exact match
         if len(digits_only) == 5:
@@ -360,35 +506,21 @@ def us_zipcode_valid(value: str) -> bool:
     if len(digits_only) not in [5, 9]:
         return False
 
-    # Check the first 5 digits (the base ZIP code)
-    base_zip = digits_only[:5]
-
-    # Reject sequential patterns in base ZIP (12345, 54321, etc.)
-    is_sequential_up = all(
-        int(base_zip[i]) == int(base_zip[i - 1]) + 1 for i in range(1, len(base_zip))
-    )
-    is_sequential_down = all(
-        int(base_zip[i]) == int(base_zip[i - 1]) - 1 for i in range(1, len(base_zip))
-    )
+    # Check the first 5 digits (the base ZIP code): a single bitset probe
+    # covers the sequential / all-same / too-round rules
+    num = int(digits_only[:5])
+    return bool((_ZIP5_BITSET[num >> 3] >> (num & 7)) & 1)
 
-    if is_sequential_up or is_sequential_down:
-        return False
 
-    # Reject all same digit in base ZIP (00000, 11111, etc.)
-    if len(set(base_zip)) == 1:
-        return False
-
-    # Reject numbers that are too round (multiples of 10000, like 50000, 60000)
-    try:
-        num = int(base_zip)
-        if num % 10000 == 0:
-            return False
-    except ValueError:
-        return False
-
-    return True
+# Known Korean bank account prefixes, split by length so the lookup is
+# a hash probe on a fixed-width slice rather than a prefix scan.
+# 110, 120, 150, 190, 830 (Kookmin), 1002 (Woori), 301 (Nonghyup),
+# 3333 (Kakao), 100 (K Bank/Toss)
+_KR_BANK_PREFIXES_3 = frozenset({"110", "120", "150", "190", "830", "301", "100"})
+_KR_BANK_PREFIXES_4 = frozenset({"1002", "3333"})
 
 
+@lru_cache(maxsize=4096)
 def korean_bank_account_valid(value: str) -> bool:
     """
     Verify Korean bank account is valid and not a timestamp.
@@ -403,89 +535,68 @@ def korean_bank_account_valid(value: str) -> bool:
         True if likely a valid bank account, False if likely timestamp/other
     """
     # Remove common separators
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if not digits_only:
         return False
 
     length = len(digits_only)
 
-    # Check if it starts with a known Korean bank prefix
-    # Common prefixes: 110, 120, 150, 190, 830 (Kookmin), 1002 (Woori),
-    # 301 (Nonghyup), 3333 (Kakao), 100 (K Bank/Toss)
-    has_known_prefix = False
-    known_prefixes = ["110", "120", "150", "190", "830", "1002", "301", "3333", "100"]
-    for prefix in known_prefixes:
-        if digits_only.startswith(prefix):
-            has_known_prefix = True
-            break
+    # Check if it starts with a known Korean bank prefix: two O(1) set
+    # lookups on the 3- and 4-digit slices instead of a startswith scan
+    # over every prefix.
+    has_known_prefix = (
+        digits_only[:3] in _KR_BANK_PREFIXES_3
+        or digits_only[:4] in _KR_BANK_PREFIXES_4
+    )
 
     # If it has a known bank prefix, be more lenient - it's likely a real bank account
     # Still check for obvious timestamps though
     if has_known_prefix:
         # For accounts with known prefixes, only reject obvious timestamps
         if length == 10:
-            try:
-                num = int(digits_only)
-                # Very tight timestamp range to avoid false positives
-                if 1600000000 <= num <= 1800000000:
-                    return False  # Current era timestamps (2020-2027)
-            except ValueError:
-                pass
+            # digits_only is digit-only by construction, so int() cannot fail
+            # Very tight timestamp range to avoid false positives
+            if 1600000000 <= int(digits_only) <= 1800000000:
+                return False  # Current era timestamps (2020-2027)
         return True  # Accept if it has a known bank prefix
 
     # For accounts without known prefixes, be more strict
     # Reject if it's a known timestamp length and range
-    # 10 digits: Unix timestamp
-    if length == 10:
-        try:
-            num = int(digits_only)
-            if 1000000000 <= num <= 9999999999:
-                return False  # Likely Unix timestamp
-        except ValueError:
-            pass
-
-    # 13 digits: Unix timestamp in milliseconds
-    if length == 13:
-        try:
-            num = int(digits_only)
-            if 1000000000000 <= num <= 9999999999999:
-                return False  # Likely Unix timestamp ms
-        except ValueError:
-            pass
+    # 10/13 digits: any value not starting with "0" falls in the Unix
+    # timestamp (ms) range, so a leading-digit check replaces the int parse
+    if length in (10, 13) and digits_only[0] != "0":
+        return False  # Likely Unix timestamp (seconds or milliseconds)
 
     # 14 digits: Compact datetime (YYYYMMDDHHMMSS)
-    if length == 14:
-        try:
-            year = int(digits_only[:4])
-            month = int(digits_only[4:6])
-            day = int(digits_only[6:8])
-
-            # Check if first 8 digits look like YYYYMMDD
-            if 1900 <= year <= 2099 and 1 <= month <= 12 and 1 <= day <= 31:
-                return False  # Likely compact datetime
-        except (ValueError, IndexError):
-            pass
+    if length == 14 and _looks_like_yyyymmdd(digits_only):
+        return False  # Likely compact datetime
 
     # Check for sequential patterns in longer numbers (but only for non-prefixed accounts)
     if length >= 10 and not has_known_prefix:
-        # Reject if too many sequential digits (like 123456789...)
-        sequential_count = 0
-        max_sequential = 0
-        for i in range(1, len(digits_only)):
-            if int(digits_only[i]) == int(digits_only[i - 1]) + 1:
-                sequential_count += 1
-                max_sequential = max(max_sequential, sequential_count)
+        # Reject if too many sequential digits (like 123456789...).
+        # Adjacent digit characters differ by 1 exactly when the digits
+        # do, so the run is counted on raw byte values without int().
+        encoded = digits_only.encode()
+        run = 0
+        for i in range(1, length):
+            if encoded[i] - encoded[i - 1] == 1:
+                run += 1
+                # 6+ consecutive sequential digits: likely not a real account
+                if run >= 6:
+                    return False
             else:
-                sequential_count = 0
-
-        # If we see 6+ consecutive sequential digits, likely not a real account
-        if max_sequential >= 6:
-            return False
+                run = 0
 
     return True
 
 
+# Separator characters checked with a single C-level isdisjoint scan
+# instead of one substring search per character.
+_SEPARATOR_CHARS = frozenset("- /")
+
+
+@lru_cache(maxsize=4096)
 def generic_number_not_timestamp(value: str) -> bool:
     """
     Verify that a numeric string is likely NOT a timestamp (for generic patterns).
@@ -501,10 +612,10 @@ def generic_number_not_timestamp(value: str) -> bool:
     """
     # Check if value contains separators (hyphens, spaces)
     # If it has separators, it's more likely a formatted account number than a timestamp
-    has_separators = any(c in value for c in ["-", " ", "/"])
+    has_separators = not _SEPARATOR_CHARS.isdisjoint(value)
 
     # Remove common separators
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if not digits_only:
         return True
@@ -515,54 +626,27 @@ def generic_number_not_timestamp(value: str) -> bool:
     # Timestamps are rarely written with separators
     if has_separators:
         # Only reject if it's clearly a datetime pattern
-        if length >= 14:
-            try:
-                year = int(digits_only[:4])
-                month = int(digits_only[4:6])
-                day = int(digits_only[6:8])
-
-                # Check if first 8 digits look like YYYYMMDD
-                if 1900 <= year <= 2099 and 1 <= month <= 12 and 1 <= day <= 31:
-                    return False  # Likely compact datetime even with separators
-            except (ValueError, IndexError):
-                pass
+        if length >= 14 and _looks_like_yyyymmdd(digits_only):
+            return False  # Likely compact datetime even with separators
         return True  # Has separators and not a datetime - likely a real account/ID
 
     # No separators - be more strict about timestamps
-    # 10 digits: Unix timestamp
-    if length == 10:
-        try:
-            num = int(digits_only)
-            if 1000000000 <= num <= 9999999999:
-                return False  # Likely Unix timestamp
-        except ValueError:
-            pass
-
-    # 13 digits: Unix timestamp in milliseconds
-    if length == 13:
-        try:
-            num = int(digits_only)
-            if 1000000000000 <= num <= 9999999999999:
-                return False  # Likely Unix timestamp ms
-        except ValueError:
-            pass
+    # 10/13 digits: any value not starting with "0" falls in the Unix
+    # timestamp (ms) range, so a leading-digit check replaces the int parse
+    if length in (10, 13) and digits_only[0] != "0":
+        return False  # Likely Unix timestamp (seconds or milliseconds)
 
     # 14+ digits: Compact datetime (YYYYMMDDHHMMSS)
-    if length >= 14:
-        try:
-            year = int(digits_only[:4])
-            month = int(digits_only[4:6])
-            day = int(digits_only[6:8])
-
-            # Check if first 8 digits look like YYYYMMDD
-            if 1900 <= year <= 2099 and 1 <= month <= 12 and 1 <= day <= 31:
-                return False  # Likely compact datetime
-        except (ValueError, IndexError):
-            pass
+    if length >= 14 and _looks_like_yyyymmdd(digits_only):
+        return False  # Likely compact datetime
 
     return True
 
 
+_ASCII_LETTERS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz")
+
+
+@lru_cache(maxsize=4096)
 def contains_letter(value: str) -> bool:
     """
     Verify that the value contains at least one letter.
@@ -573,9 +657,15 @@ def contains_letter(value: str) -> bool:
     Returns:
         True if value contains at least one letter, False otherwise
     """
-    return any(c.isalpha() for c in value)
+    # isdisjoint short-circuits in C on the first ASCII letter; the
+    # per-character isalpha loop only runs for non-ASCII input, keeping
+    # Unicode letters (e.g. Hangul) recognized as before.
+    if not _ASCII_LETTERS.isdisjoint(value):
+        return True
+    return not value.isascii() and any(c.isalpha() for c in value)
 
 
+@lru_cache(maxsize=4096)
 def us_ssn_valid(value: str) -> bool:
     """
     Verify US SSN is valid.
@@ -591,7 +681,7 @@ def us_ssn_valid(value: str) -> bool:
     Returns:
         True if valid SSN format, False otherwise
     """
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
     if len(digits) != 9:
         return False
 
@@ -677,6 +767,7 @@ JAPANESE_SURNAMES = {
 }
 
 
+@lru_cache(maxsize=4096)
 def chinese_name_valid(value: str) -> bool:
     """
     Verify Chinese name has a valid surname prefix.
@@ -701,6 +792,7 @@ def chinese_name_valid(value: str) -> bool:
     return value[0] in CHINESE_SURNAMES
 
 
+@lru_cache(maxsize=4096)
 def korean_name_valid(value: str) -> bool:
     """
     Verify Korean name has a valid surname prefix.
@@ -725,6 +817,7 @@ def korean_name_valid(value: str) -> bool:
     return value[0] in KOREAN_SURNAMES
 
 
+@lru_cache(maxsize=4096)
 def japanese_name_kanji_valid(value: str) -> bool:
     """
     Verify Japanese name (kanji) matches known surname patterns.
@@ -757,6 +850,7 @@ def japanese_name_kanji_valid(value: str) -> bool:
     return value[0] in JAPANESE_SURNAMES
 
 
+@lru_cache(maxsize=4096)
 def cjk_name_standalone(value: str) -> bool:
     """
     Verify that a CJK name match is standalone (expected length for a name).
@@ -785,23 +879,17 @@ def cjk_name_standalone(value: str) -> bool:
     if len(value) > 6:
         return False
 
-    # Check it's all CJK characters (no mixing with ASCII)
-    for char in value:
-        code = ord(char)
-        # CJK ranges: Chinese (4E00-9FFF), Korean Hangul (AC00-D7AF),
-        # Japanese Hiragana (3040-309F), Katakana (30A0-30FF), CJK (4E00-9FFF)
-        is_cjk = (
-            0x4E00 <= code <= 0x9FFF or  # CJK Unified Ideographs
-            0xAC00 <= code <= 0xD7AF or  # Korean Hangul
-            0x3040 <= code <= 0x309F or  # Hiragana
-            0x30A0 <= code <= 0x30FF     # Katakana
-        )
-        if not is_cjk:
-            return False
+    # Check it's all CJK characters (no mixing with ASCII): one C-level
+    # scan for a non-CJK char instead of four range tests per ord()
+    return _NON_CJK_RE.search(value) is None
 
-    return True
+
+# CN national ID checksum weights and check-digit alphabet
+_CN_ID_WEIGHTS = (7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2)
+_CN_ID_CHECK_DIGITS = "10X98765432"
 
 
+@lru_cache(maxsize=4096)
 def cn_national_id_valid(value: str) -> bool:
     """
     Verify Chinese National ID (18 digits) using checksum algorithm.
@@ -820,8 +908,8 @@ def cn_national_id_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Remove spaces and convert to uppercase
-    id_str = value.replace(" ", "").upper()
+    # Strip spaces and uppercase in one translate pass
+    id_str = value.translate(_UPPER_NO_SPACE)
 
     if len(id_str) != 18:
         return False
@@ -857,24 +945,24 @@ def cn_national_id_valid(value: str) -> bool:
             return False
 
         # More precise day validation per month
-        days_in_month = [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-        if day > days_in_month[month]:
+        if day > _DAYS_IN_MONTH[month]:
             return False
     except (ValueError, IndexError):
         return False
 
     # Calculate checksum
-    weights = [7, 9, 10, 5, 8, 4, 2, 1, 6, 3, 7, 9, 10, 5, 8, 4, 2]
-    check_digits = ['1', '0', 'X', '9', '8', '7', '6', '5', '4', '3', '2']
-
-    try:
-        total = sum(int(id_str[i]) * weights[i] for i in range(17))
-        expected_check = check_digits[total % 11]
-        return id_str[17] == expected_check
-    except (ValueError, IndexError):
+    head = id_str[:17]
+    if not head.isdigit():
         return False
+    total = _weighted_digit_sum(head, _CN_ID_WEIGHTS)
+    return id_str[17] == _CN_ID_CHECK_DIGITS[total % 11]
+
 
+# TW national ID weights for the eight middle digits
+_TW_ID_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 1)
 
+
+@lru_cache(maxsize=4096)
 def tw_national_id_valid(value: str) -> bool:
     """
     Verify Taiwan National ID using checksum algorithm.
@@ -896,7 +984,7 @@ def tw_national_id_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    id_str = value.replace(" ", "").upper()
+    id_str = value.translate(_UPPER_NO_SPACE)
 
     if len(id_str) != 10:
         return False
@@ -929,9 +1017,7 @@ def tw_national_id_valid(value: str) -> bool:
     total = first_digit * 1 + second_digit * 9
 
     # Weights for digits 2-9 (positions 1-8 in string, 0-indexed)
-    weights = [8, 7, 6, 5, 4, 3, 2, 1]
-    for i, weight in enumerate(weights):
-        total += int(id_str[i + 1]) * weight
+    total += _weighted_digit_sum(id_str[1:9], _TW_ID_WEIGHTS)
 
     # Add check digit (last digit)
     total += int(id_str[9])
@@ -939,6 +1025,35 @@ def tw_national_id_valid(value: str) -> bool:
     return total % 10 == 0
 
 
+# Verhoeff multiplication (d) and permutation (p) tables, flattened
+# row-major into bytes so each lookup is one C-level index instead of a
+# nested-sequence access. Row i starts at offset i * 10.
+_VERHOEFF_D = bytes((
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    1, 2, 3, 4, 0, 6, 7, 8, 9, 5,
+    2, 3, 4, 0, 1, 7, 8, 9, 5, 6,
+    3, 4, 0, 1, 2, 8, 9, 5, 6, 7,
+    4, 0, 1, 2, 3, 9, 5, 6, 7, 8,
+    5, 9, 8, 7, 6, 0, 4, 3, 2, 1,
+    6, 5, 9, 8, 7, 1, 0, 4, 3, 2,
+    7, 6, 5, 9, 8, 2, 1, 0, 4, 3,
+    8, 7, 6, 5, 9, 3, 2, 1, 0, 4,
+    9, 8, 7, 6, 5, 4, 3, 2, 1, 0,
+))
+
+_VERHOEFF_P = bytes((
+    0, 1, 2, 3, 4, 5, 6, 7, 8, 9,
+    1, 5, 7, 6, 2, 8, 3, 0, 9, 4,
+    5, 8, 0, 3, 7, 9, 6, 1, 4, 2,
+    8, 9, 1, 6, 0, 4, 3, 5, 2, 7,
+    9, 4, 5, 3, 1, 2, 6, 8, 7, 0,
+    4, 2, 8, 6, 5, 7, 3, 9, 0, 1,
+    2, 7, 9, 3, 8, 0, 6, 4, 1, 5,
+    7, 0, 4, 6, 9, 1, 3, 2, 5, 8,
+))
+
+
+@lru_cache(maxsize=4096)
 def india_aadhaar_valid(value: str) -> bool:
     """
     Verify India Aadhaar number using Verhoeff checksum algorithm.
@@ -957,7 +1072,7 @@ def india_aadhaar_valid(value: str) -> bool:
         True if valid, False otherwise
     """
     # Remove separators
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if len(digits_only) != 12:
         return False
@@ -967,44 +1082,24 @@ def india_aadhaar_valid(value: str) -> bool:
         return False
 
     # Reject all same digits
-    if len(set(digits_only)) == 1:
-        return False
-
-    # Verhoeff multiplication table
-    d = [
-        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-        [1, 2, 3, 4, 0, 6, 7, 8, 9, 5],
-        [2, 3, 4, 0, 1, 7, 8, 9, 5, 6],
-        [3, 4, 0, 1, 2, 8, 9, 5, 6, 7],
-        [4, 0, 1, 2, 3, 9, 5, 6, 7, 8],
-        [5, 9, 8, 7, 6, 0, 4, 3, 2, 1],
-        [6, 5, 9, 8, 7, 1, 0, 4, 3, 2],
-        [7, 6, 5, 9, 8, 2, 1, 0, 4, 3],
-        [8, 7, 6, 5, 9, 3, 2, 1, 0, 4],
-        [9, 8, 7, 6, 5, 4, 3, 2, 1, 0],
-    ]
-
-    # Verhoeff permutation table
-    p = [
-        [0, 1, 2, 3, 4, 5, 6, 7, 8, 9],
-        [1, 5, 7, 6, 2, 8, 3, 0, 9, 4],
-        [5, 8, 0, 3, 7, 9, 6, 1, 4, 2],
-        [8, 9, 1, 6, 0, 4, 3, 5, 2, 7],
-        [9, 4, 5, 3, 1, 2, 6, 8, 7, 0],
-        [4, 2, 8, 6, 5, 7, 3, 9, 0, 1],
-        [2, 7, 9, 3, 8, 0, 6, 4, 1, 5],
-        [7, 0, 4, 6, 9, 1, 3, 2, 5, 8],
-    ]
+    if _all_same(digits_only):
+        return False
 
     # Calculate Verhoeff checksum
     c = 0
     reversed_digits = digits_only[::-1]
     for i, char in enumerate(reversed_digits):
-        c = d[c][p[i % 8][int(char)]]
+        c = _VERHOEFF_D[c * 10 + _VERHOEFF_P[(i % 8) * 10 + ord(char) - 48]]
 
     return c == 0
 
 
+# PAN entity-type codes (4th character), hoisted so the set is not
+# rebuilt on every call
+_PAN_ENTITY_TYPES = frozenset("ABCFGHJKLPT")
+
+
+@lru_cache(maxsize=4096)
 def india_pan_valid(value: str) -> bool:
     """
     Verify India PAN (Permanent Account Number) format.
@@ -1032,7 +1127,7 @@ def india_pan_valid(value: str) -> bool:
     Returns:
         True if valid PAN format, False otherwise
     """
-    pan = value.replace(" ", "").upper()
+    pan = value.translate(_UPPER_NO_SPACE)
 
     if len(pan) != 10:
         return False
@@ -1042,8 +1137,7 @@ def india_pan_valid(value: str) -> bool:
         return False
 
     # Valid 4th character (entity type)
-    valid_entity_types = {'A', 'B', 'C', 'F', 'G', 'H', 'J', 'K', 'L', 'P', 'T'}
-    if pan[3] not in valid_entity_types:
+    if pan[3] not in _PAN_ENTITY_TYPES:
         return False
 
     # Reject obvious test patterns
@@ -1053,6 +1147,11 @@ def india_pan_valid(value: str) -> bool:
     return True
 
 
+# KR business registration checksum weights
+_KR_BIZ_WEIGHTS = (1, 3, 7, 1, 3, 7, 1, 3, 5)
+
+
+@lru_cache(maxsize=4096)
 def kr_business_registration_valid(value: str) -> bool:
     """
     Verify Korean Business Registration Number (사업자등록번호) checksum.
@@ -1072,22 +1171,21 @@ def kr_business_registration_valid(value: str) -> bool:
         True if valid, False otherwise
     """
     # Remove hyphens
-    digits_only = "".join(c for c in value if c.isdigit())
+    digits_only = _strip_non_digits(value)
 
     if len(digits_only) != 10:
         return False
 
     # Reject all same digits or sequential
-    if len(set(digits_only)) == 1:
+    if _all_same(digits_only):
         return False
 
     # Checksum calculation
-    weights = [1, 3, 7, 1, 3, 7, 1, 3, 5]
     total = 0
 
     for i in range(9):
         digit = int(digits_only[i])
-        total += digit * weights[i]
+        total += digit * _KR_BIZ_WEIGHTS[i]
         # Special handling for 9th position
         if i == 8:
             total += (digit * 5) // 10
@@ -1097,6 +1195,23 @@ def kr_business_registration_valid(value: str) -> bool:
     return int(digits_only[9]) == check_digit
 
 
+# Non-public IPv4 blocks as (low, high) 32-bit ranges, checked against
+# the packed address instead of per-octet branching.
+_IPV4_NONPUBLIC = (
+    (0x00000000, 0x00FFFFFF),  # 0.0.0.0/8 - Current network
+    (0x0A000000, 0x0AFFFFFF),  # 10.0.0.0/8 - Private
+    (0x7F000000, 0x7FFFFFFF),  # 127.0.0.0/8 - Loopback
+    (0xA9FE0000, 0xA9FEFFFF),  # 169.254.0.0/16 - Link-local
+    (0xAC100000, 0xAC1FFFFF),  # 172.16.0.0/12 - Private
+    (0xC0000200, 0xC00002FF),  # 192.0.2.0/24 - Documentation (TEST-NET-1)
+    (0xC0A80000, 0xC0A8FFFF),  # 192.168.0.0/16 - Private
+    (0xC6336400, 0xC63364FF),  # 198.51.100.0/24 - Documentation (TEST-NET-2)
+    (0xCB007100, 0xCB0071FF),  # 203.0.113.0/24 - Documentation (TEST-NET-3)
+    (0xE0000000, 0xFFFFFFFF),  # 224.0.0.0/4 multicast + 240.0.0.0/4 reserved
+)
+
+
+@lru_cache(maxsize=4096)
 def ipv4_public(value: str) -> bool:
     """
     Verify IPv4 address is a public (routable) address.
@@ -1115,77 +1230,62 @@ def ipv4_public(value: str) -> bool:
     Returns:
         True if public IP, False if private/reserved
     """
-    try:
-        parts = value.split('.')
-        if len(parts) != 4:
-            return False
-
-        octets = [int(p) for p in parts]
-
-        # Validate octets are in range
-        if not all(0 <= o <= 255 for o in octets):
-            return False
-
-        first, second, third, fourth = octets
-
-        # 0.0.0.0/8 - Current network
-        if first == 0:
-            return False
-
-        # 10.0.0.0/8 - Private
-        if first == 10:
-            return False
-
-        # 127.0.0.0/8 - Loopback
-        if first == 127:
-            return False
+    parts = value.split('.')
+    if len(parts) != 4:
+        return False
 
-        # 169.254.0.0/16 - Link-local
-        if first == 169 and second == 254:
-            return False
+    try:
+        first, second, third, fourth = (int(p) for p in parts)
+    except ValueError:
+        return False
 
-        # 172.16.0.0/12 - Private (172.16.0.0 - 172.31.255.255)
-        if first == 172 and 16 <= second <= 31:
-            return False
+    # Validate octets are in range
+    if (first | second | third | fourth) & ~0xFF:
+        return False
 
-        # 192.0.2.0/24 - Documentation (TEST-NET-1)
-        if first == 192 and second == 0 and third == 2:
-            return False
+    # Pack into a 32-bit integer and test against the non-public ranges
+    ip = (first << 24) | (second << 16) | (third << 8) | fourth
 
-        # 192.168.0.0/16 - Private
-        if first == 192 and second == 168:
+    for low, high in _IPV4_NONPUBLIC:
+        if low <= ip <= high:
             return False
 
-        # 198.51.100.0/24 - Documentation (TEST-NET-2)
-        if first == 198 and second == 51 and third == 100:
-            return False
+    return True
 
-        # 203.0.113.0/24 - Documentation (TEST-NET-3)
-        if first == 203 and second == 0 and third == 113:
-            return False
 
-        # 224.0.0.0/4 - Multicast
-        if 224 <= first <= 239:
-            return False
+def _shortest_period(value: str) -> int:
+    """
+    Length of the shortest repeating unit of value.
 
-        # 240.0.0.0/4 - Reserved for future use
-        if first >= 240:
-            return False
+    Computed from the KMP failure function: the shortest period is
+    len(value) minus the longest proper border. Runs in O(n) regardless
+    of how many unit lengths divide the string.
+    """
+    n = len(value)
+    if not n:
+        return 0
 
-        return True
+    pi = [0] * n
+    k = 0
+    for i in range(1, n):
+        char = value[i]
+        while k and value[k] != char:
+            k = pi[k - 1]
+        if value[k] == char:
+            k += 1
+        pi[i] = k
 
-    except (ValueError, AttributeError):
-        return False
+    return n - pi[-1]
 
 
+@lru_cache(maxsize=4096)
 def not_repeating_pattern(value: str) -> bool:
     """
     Verify that a value is not a simple repeating pattern.
 
     Rejects patterns like:
     - All same character: "1111111", "AAAAAAA"
-    - Two-char repeat: "121212", "ABABAB"
-    - Three-char repeat: "123123123"
+    - Short repeating units: "121212", "ABABAB", "123123123"
     - Sequential: "12345678", "ABCDEFGH"
 
     Args:
@@ -1197,41 +1297,54 @@ def not_repeating_pattern(value: str) -> bool:
     if not value or len(value) < 4:
         return True
 
-    # Check all same character
-    if len(set(value)) == 1:
+    # C-level fast paths for the overwhelmingly common rejects: constant
+    # strings via bytes.count and period-2/3 units via slice equality,
+    # so typical repeating inputs never reach the Python-level loop.
+    encoded = value.encode()
+    n = len(encoded)
+    if encoded.count(encoded[:1]) == n:
         return False
-
-    # Check for sequential digits
-    digits_only = "".join(c for c in value if c.isdigit())
-    if len(digits_only) >= 4:
-        is_ascending = all(
-            int(digits_only[i]) == int(digits_only[i - 1]) + 1
-            for i in range(1, len(digits_only))
-        )
-        is_descending = all(
-            int(digits_only[i]) == int(digits_only[i - 1]) - 1
-            for i in range(1, len(digits_only))
-        )
-        if is_ascending or is_descending:
-            return False
-
-    # Check for 2-char repeating pattern
-    if len(value) >= 4:
-        pattern2 = value[:2]
-        if pattern2 * (len(value) // 2) == value[:len(pattern2) * (len(value) // 2)]:
-            if len(value) % 2 == 0 or value[-(len(value) % 2):] == pattern2[:len(value) % 2]:
+    for period in (2, 3):
+        if n >= 2 * period and encoded[: n - n % period] == encoded[:period] * (n // period):
+            if n % period == 0 or encoded[-(n % period):] == encoded[: n % period]:
                 return False
 
-    # Check for 3-char repeating pattern
-    if len(value) >= 6:
-        pattern3 = value[:3]
-        if pattern3 * (len(value) // 3) == value[:len(pattern3) * (len(value) // 3)]:
-            if len(value) % 3 == 0 or value[-(len(value) % 3):] == pattern3[:len(value) % 3]:
-                return False
+    # Shortest-period check: one O(n) pass covers any remaining
+    # repeating unit that spans at least half the string.
+    if _shortest_period(value) * 2 <= len(value):
+        return False
+
+    # Check for sequential digits
+    digits_only = _strip_non_digits(value)
+    if len(digits_only) >= 4 and _is_monotone_step1(digits_only):
+        return False
 
     return True
 
 
+# Card network BIN ranges normalized to 6-digit (low, high) pairs,
+# merged and sorted for binary search. Discover's 622126-622925 block
+# is subsumed by the UnionPay 62 range.
+_BIN_RANGES = (
+    (222100, 272099),  # Mastercard 2221-2720
+    (300000, 305999),  # Diners Club 300-305
+    (340000, 349999),  # American Express 34
+    (352800, 358999),  # JCB 3528-3589
+    (360000, 369999),  # Diners Club 36
+    (370000, 379999),  # American Express 37
+    (380000, 389999),  # Diners Club 38
+    (400000, 499999),  # Visa 4
+    (510000, 559999),  # Mastercard 51-55
+    (601100, 601199),  # Discover 6011
+    (620000, 629999),  # UnionPay 62
+    (644000, 649999),  # Discover 644-649
+    (650000, 659999),  # Discover 65
+)
+_BIN_STARTS = tuple(low for low, _ in _BIN_RANGES)
+_BIN_ENDS = tuple(high for _, high in _BIN_RANGES)
+
+
+@lru_cache(maxsize=4096)
 def credit_card_bin_valid(value: str) -> bool:
     """
     Verify credit card number has valid BIN (Bank Identification Number) prefix.
@@ -1254,76 +1367,29 @@ def credit_card_bin_valid(value: str) -> bool:
         True if valid BIN and Luhn, False otherwise
     """
     # Remove non-digits
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) < 13 or len(digits) > 19:
         return False
 
-    # Check BIN ranges
-    valid_bin = False
-
-    # Visa: starts with 4
-    if digits[0] == '4':
-        valid_bin = True
-
-    # Mastercard: 51-55 or 2221-2720
-    elif len(digits) >= 2:
-        prefix2 = int(digits[:2])
-        if 51 <= prefix2 <= 55:
-            valid_bin = True
-        elif len(digits) >= 4:
-            prefix4 = int(digits[:4])
-            if 2221 <= prefix4 <= 2720:
-                valid_bin = True
-
-    # American Express: 34 or 37
-    if not valid_bin and len(digits) >= 2:
-        prefix2 = int(digits[:2])
-        if prefix2 in (34, 37):
-            valid_bin = True
-
-    # Discover: 6011, 622126-622925, 644-649, 65
-    if not valid_bin:
-        if digits.startswith('6011'):
-            valid_bin = True
-        elif digits.startswith('65'):
-            valid_bin = True
-        elif len(digits) >= 3:
-            prefix3 = int(digits[:3])
-            if 644 <= prefix3 <= 649:
-                valid_bin = True
-        if not valid_bin and len(digits) >= 6:
-            prefix6 = int(digits[:6])
-            if 622126 <= prefix6 <= 622925:
-                valid_bin = True
-
-    # JCB: 3528-3589
-    if not valid_bin and len(digits) >= 4:
-        prefix4 = int(digits[:4])
-        if 3528 <= prefix4 <= 3589:
-            valid_bin = True
-
-    # UnionPay: 62
-    if not valid_bin and digits.startswith('62'):
-        valid_bin = True
-
-    # Diners Club: 36, 38, 300-305
-    if not valid_bin and len(digits) >= 2:
-        prefix2 = int(digits[:2])
-        if prefix2 in (36, 38):
-            valid_bin = True
-        elif len(digits) >= 3:
-            prefix3 = int(digits[:3])
-            if 300 <= prefix3 <= 305:
-                valid_bin = True
-
-    if not valid_bin:
+    # Check BIN ranges: length >= 13 guarantees six digits, so one
+    # 6-digit parse and a binary search over the sorted range table
+    # replaces the per-network prefix cascade.
+    prefix = int(digits[:6])
+    i = bisect_right(_BIN_STARTS, prefix) - 1
+    if i < 0 or prefix > _BIN_ENDS[i]:
         return False
 
     # Also verify Luhn checksum
     return luhn(digits)
 
 
+# Days per month (index 0 unused, Feb holds the leap-year maximum; the
+# precise Feb 29 check lives in _is_valid_date). Module-level so the
+# table is built once, not per call.
+_DAYS_IN_MONTH = (0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
 def _is_valid_date(year: int, month: int, day: int) -> bool:
     """
     Helper function to validate a date.
@@ -1338,13 +1404,7 @@ def _is_valid_date(year: int, month: int, day: int) -> bool:
     """
     if month < 1 or month > 12:
         return False
-    if day < 1 or day > 31:
-        return False
-
-    # Days per month (index 0 unused, Feb assumes leap year for simplicity)
-    days_in_month = [0, 31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-    if day > days_in_month[month]:
+    if day < 1 or day > _DAYS_IN_MONTH[month]:
         return False
 
     # More precise Feb check for non-leap years
@@ -1356,6 +1416,11 @@ def _is_valid_date(year: int, month: int, day: int) -> bool:
     return True
 
 
+# KR resident registration number checksum weights
+_KR_RRN_WEIGHTS = (2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5)
+
+
+@lru_cache(maxsize=4096)
 def kr_rrn_valid(value: str) -> bool:
     """
     Verify Korean Resident Registration Number (주민등록번호).
@@ -1378,19 +1443,14 @@ def kr_rrn_valid(value: str) -> bool:
         True if valid RRN format, False otherwise
     """
     # Remove hyphen
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 13:
         return False
 
-    # Parse date components
-    try:
-        yy = int(digits[0:2])
-        month = int(digits[2:4])
-        day = int(digits[4:6])
-        gender_century = int(digits[6])
-    except ValueError:
-        return False
+    # Parse date components (digits is digit-only by construction)
+    yy, month, day = _parse_yymmdd(digits)
+    gender_century = int(digits[6])
 
     # Validate gender/century indicator (1-4 for Korean citizens)
     if gender_century < 1 or gender_century > 4:
@@ -1407,18 +1467,17 @@ def kr_rrn_valid(value: str) -> bool:
         return False
 
     # Reject obviously fake patterns
-    if len(set(digits)) == 1:  # All same digits
+    if _all_same(digits):  # All same digits
         return False
 
     # Optional: Verify checksum (RRN has a weighted checksum)
-    # Weights: 2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5
-    weights = [2, 3, 4, 5, 6, 7, 8, 9, 2, 3, 4, 5]
-    total = sum(int(digits[i]) * weights[i] for i in range(12))
+    total = _weighted_digit_sum(digits, _KR_RRN_WEIGHTS)
     check_digit = (11 - (total % 11)) % 10
 
     return int(digits[12]) == check_digit
 
 
+@lru_cache(maxsize=4096)
 def kr_alien_registration_valid(value: str) -> bool:
     """
     Verify Korean Alien Registration Number (외국인등록번호).
@@ -1440,19 +1499,14 @@ def kr_alien_registration_valid(value: str) -> bool:
         True if valid format, False otherwise
     """
     # Remove hyphen
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 13:
         return False
 
-    # Parse date components
-    try:
-        yy = int(digits[0:2])
-        month = int(digits[2:4])
-        day = int(digits[4:6])
-        gender_century = int(digits[6])
-    except ValueError:
-        return False
+    # Parse date components (digits is digit-only by construction)
+    yy, month, day = _parse_yymmdd(digits)
+    gender_century = int(digits[6])
 
     # Validate gender/century indicator (5-8 for foreigners)
     if gender_century < 5 or gender_century > 8:
@@ -1469,12 +1523,17 @@ def kr_alien_registration_valid(value: str) -> bool:
         return False
 
     # Reject obviously fake patterns
-    if len(set(digits)) == 1:
+    if _all_same(digits):
         return False
 
     return True
 
 
+# JP My Number checksum weights
+_JP_MY_NUMBER_WEIGHTS = (6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2)
+
+
+@lru_cache(maxsize=4096)
 def jp_my_number_valid(value: str) -> bool:
     """
     Verify Japanese My Number (マイナンバー) checksum.
@@ -1494,24 +1553,21 @@ def jp_my_number_valid(value: str) -> bool:
         True if valid checksum, False otherwise
     """
     # Remove separators
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 12:
         return False
 
     # Reject all same digits
-    if len(set(digits)) == 1:
+    if _all_same(digits):
         return False
 
     # Reject sequential patterns
     if digits in ("123456789012", "012345678901"):
         return False
 
-    # Calculate checksum
-    # Weights for positions 0-10 (first 11 digits)
-    weights = [6, 5, 4, 3, 2, 7, 6, 5, 4, 3, 2]
-
-    total = sum(int(digits[i]) * weights[i] for i in range(11))
+    # Calculate checksum over the first 11 digits
+    total = _weighted_digit_sum(digits, _JP_MY_NUMBER_WEIGHTS)
     remainder = total % 11
 
     if remainder <= 1:
@@ -1522,6 +1578,11 @@ def jp_my_number_valid(value: str) -> bool:
     return int(digits[11]) == expected_check
 
 
+# KR corporate registration checksum weights
+_KR_CORP_WEIGHTS = (1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2)
+
+
+@lru_cache(maxsize=4096)
 def kr_corporate_registration_valid(value: str) -> bool:
     """
     Verify Korean Corporate Registration Number (법인등록번호) checksum.
@@ -1540,21 +1601,20 @@ def kr_corporate_registration_valid(value: str) -> bool:
         True if valid, False otherwise
     """
     # Remove hyphen
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 13:
         return False
 
     # Reject all same digits
-    if len(set(digits)) == 1:
+    if _all_same(digits):
         return False
 
     # Checksum calculation
-    weights = [1, 2, 1, 2, 1, 2, 1, 2, 1, 2, 1, 2]
     total = 0
 
     for i in range(12):
-        product = int(digits[i]) * weights[i]
+        product = int(digits[i]) * _KR_CORP_WEIGHTS[i]
         if product > 9:
             product -= 9
         total += product
@@ -1564,6 +1624,7 @@ def kr_corporate_registration_valid(value: str) -> bool:
     return int(digits[12]) == check_digit
 
 
+@lru_cache(maxsize=4096)
 def spain_dni_valid(value: str) -> bool:
     """
     Verify Spanish DNI (Documento Nacional de Identidad) checksum.
@@ -1579,8 +1640,8 @@ def spain_dni_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Remove spaces
-    dni = value.replace(" ", "").upper()
+    # Strip spaces and uppercase in one translate pass
+    dni = value.translate(_UPPER_NO_SPACE)
 
     if len(dni) != 9:
         return False
@@ -1598,6 +1659,7 @@ def spain_dni_valid(value: str) -> bool:
     return dni[8] == expected_letter
 
 
+@lru_cache(maxsize=4096)
 def spain_nie_valid(value: str) -> bool:
     """
     Verify Spanish NIE (Número de Identidad de Extranjero) checksum.
@@ -1614,8 +1676,8 @@ def spain_nie_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    # Remove spaces
-    nie = value.replace(" ", "").upper()
+    # Strip spaces and uppercase in one translate pass
+    nie = value.translate(_UPPER_NO_SPACE)
 
     if len(nie) != 9:
         return False
@@ -1645,6 +1707,11 @@ def spain_nie_valid(value: str) -> bool:
     return nie[8] == expected_letter
 
 
+# NL BSN 11-proof weights (check digit weighted -1)
+_NL_BSN_WEIGHTS = (9, 8, 7, 6, 5, 4, 3, 2, -1)
+
+
+@lru_cache(maxsize=4096)
 def netherlands_bsn_valid(value: str) -> bool:
     """
     Verify Dutch BSN (Burgerservicenummer) using 11-proof algorithm.
@@ -1663,7 +1730,7 @@ def netherlands_bsn_valid(value: str) -> bool:
     Returns:
         True if valid 11-proof, False otherwise
     """
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) == 8:
         digits = "0" + digits
@@ -1671,16 +1738,23 @@ def netherlands_bsn_valid(value: str) -> bool:
         return False
 
     # Reject all same digits
-    if len(set(digits)) == 1:
+    if _all_same(digits):
         return False
 
     # 11-proof check
-    weights = [9, 8, 7, 6, 5, 4, 3, 2, -1]
-    total = sum(int(digits[i]) * weights[i] for i in range(9))
+    total = _weighted_digit_sum(digits, _NL_BSN_WEIGHTS)
 
     return total % 11 == 0
 
 
+# PL PESEL checksum weights
+_PL_PESEL_WEIGHTS = (1, 3, 7, 9, 1, 3, 7, 9, 1, 3)
+
+# PESEL century by month-band: months 1-12 plus 20 per band (see docstring).
+_PESEL_CENTURY = (1900, 2000, 2100, 2200, 1800)
+
+
+@lru_cache(maxsize=4096)
 def poland_pesel_valid(value: str) -> bool:
     """
     Verify Polish PESEL checksum.
@@ -1707,54 +1781,38 @@ def poland_pesel_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 11:
         return False
 
     # Reject all same digits
-    if len(set(digits)) == 1:
+    if _all_same(digits):
         return False
 
     # Parse and validate date
-    try:
-        yy = int(digits[0:2])
-        mm = int(digits[2:4])
-        dd = int(digits[4:6])
-    except ValueError:
-        return False
+    yy, mm, dd = _parse_yymmdd(digits)
 
-    # Decode month and century
-    if 1 <= mm <= 12:
-        year = 1900 + yy
-        month = mm
-    elif 21 <= mm <= 32:
-        year = 2000 + yy
-        month = mm - 20
-    elif 41 <= mm <= 52:
-        year = 2100 + yy
-        month = mm - 40
-    elif 61 <= mm <= 72:
-        year = 2200 + yy
-        month = mm - 60
-    elif 81 <= mm <= 92:
-        year = 1800 + yy
-        month = mm - 80
-    else:
+    # Decode month and century: each 20-month band maps to a century, and
+    # positions 12-19 within a band (and mm == 0) are invalid.
+    century_band, month_index = divmod(mm - 1, 20)
+    if month_index >= 12:
         return False
+    year = _PESEL_CENTURY[century_band] + yy
+    month = month_index + 1
 
     # Validate date
     if not _is_valid_date(year, month, dd):
         return False
 
     # Checksum verification
-    weights = [1, 3, 7, 9, 1, 3, 7, 9, 1, 3]
-    total = sum(int(digits[i]) * weights[i] for i in range(10))
+    total = _weighted_digit_sum(digits, _PL_PESEL_WEIGHTS)
     check_digit = (10 - (total % 10)) % 10
 
     return int(digits[10]) == check_digit
 
 
+@lru_cache(maxsize=4096)
 def sweden_personnummer_valid(value: str) -> bool:
     """
     Verify Swedish Personnummer using Luhn algorithm.
@@ -1771,7 +1829,7 @@ def sweden_personnummer_valid(value: str) -> bool:
         True if valid Luhn checksum, False otherwise
     """
     # Remove separators
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) == 12:
         # Full format YYYYMMDDXXXX - use last 10 digits
@@ -1780,12 +1838,7 @@ def sweden_personnummer_valid(value: str) -> bool:
         return False
 
     # Parse and validate date
-    try:
-        yy = int(digits[0:2])
-        mm = int(digits[2:4])
-        dd = int(digits[4:6])
-    except ValueError:
-        return False
+    yy, mm, dd = _parse_yymmdd(digits)
 
     # Basic date validation (assume 1900s or 2000s)
     if mm < 1 or mm > 12:
@@ -1797,6 +1850,7 @@ def sweden_personnummer_valid(value: str) -> bool:
     return luhn(digits)
 
 
+@lru_cache(maxsize=4096)
 def france_insee_valid(value: str) -> bool:
     """
     Verify French INSEE/NIR number (Numéro de Sécurité Sociale).
@@ -1847,13 +1901,13 @@ def france_insee_valid(value: str) -> bool:
 
     # Calculate checksum
     # Check digits = 97 - (first 13 digits % 97)
-    base_number = int(calc_str[:13])
-    expected_check = 97 - (base_number % 97)
+    expected_check = 97 - _mod97(calc_str[:13])
     actual_check = int(calc_str[13:15])
 
     return actual_check == expected_check
 
 
+@lru_cache(maxsize=4096)
 def belgium_rrn_valid(value: str) -> bool:
     """
     Verify Belgian Rijksregisternummer (National Register Number).
@@ -1872,18 +1926,13 @@ def belgium_rrn_valid(value: str) -> bool:
         True if valid, False otherwise
     """
     # Remove separators
-    digits = "".join(c for c in value if c.isdigit())
+    digits = _strip_non_digits(value)
 
     if len(digits) != 11:
         return False
 
     # Parse date
-    try:
-        yy = int(digits[0:2])
-        mm = int(digits[2:4])
-        dd = int(digits[4:6])
-    except ValueError:
-        return False
+    yy, mm, dd = _parse_yymmdd(digits)
 
     # Basic date validation
     if mm < 1 or mm > 12:
@@ -1891,23 +1940,22 @@ def belgium_rrn_valid(value: str) -> bool:
     if dd < 1 or dd > 31:
         return False
 
-    # Get the base number and check digits
-    base_9 = int(digits[:9])
+    # Get the check digits
     check_digits = int(digits[9:11])
 
     # Try 1900s calculation first
-    expected_check_1900 = 97 - (base_9 % 97)
+    expected_check_1900 = 97 - _mod97(digits[:9])
 
     if check_digits == expected_check_1900:
         return True
 
     # Try 2000s calculation (prepend "2")
-    base_9_2000 = int("2" + digits[:9])
-    expected_check_2000 = 97 - (base_9_2000 % 97)
+    expected_check_2000 = 97 - _mod97("2" + digits[:9])
 
     return check_digits == expected_check_2000
 
 
+@lru_cache(maxsize=4096)
 def finland_hetu_valid(value: str) -> bool:
     """
     Verify Finnish HETU (Henkilötunnus).
@@ -1927,7 +1975,7 @@ def finland_hetu_valid(value: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    hetu = value.replace(" ", "").upper()
+    hetu = value.translate(_UPPER_NO_SPACE)
 
     if len(hetu) != 11:
         return False
@@ -1974,8 +2022,10 @@ def finland_hetu_valid(value: str) -> bool:
     return check_char == expected_check
 
 
-# Registry of verification functions
-VERIFICATION_FUNCTIONS: Dict[str, Callable[[str], bool]] = {
+# Registry of verification functions. The dict itself stays private;
+# register/unregister mutate it and the public read-only proxy below
+# reflects the changes live.
+_VERIFICATION_REGISTRY: Dict[str, Callable[[str], bool]] = {
     "iban_mod97": iban_mod97,
     "luhn": luhn,
     "dms_coordinate": dms_coordinate,
@@ -2018,6 +2068,15 @@ VERIFICATION_FUNCTIONS: Dict[str, Callable[[str], bool]] = {
     "finland_hetu_valid": finland_hetu_valid,
 }
 
+# Public read-only view of the registry.
+VERIFICATION_FUNCTIONS: Mapping[str, Callable[[str], bool]] = MappingProxyType(
+    _VERIFICATION_REGISTRY
+)
+
+# Bound lookup method, so get_verification_function resolves one global
+# instead of a global plus an attribute on every call.
+_REGISTRY_GET = _VERIFICATION_REGISTRY.get
+
 
 def get_verification_function(name: str) -> Optional[Callable[[str], bool]]:
     """
@@ -2029,7 +2088,47 @@ def get_verification_function(name: str) -> Optional[Callable[[str], bool]]:
     Returns:
         Verification function or None if not found
     """
-    return VERIFICATION_FUNCTIONS.get(name)
+    return _REGISTRY_GET(name)
+
+
+def verify_batch(name: str, values: Iterable[str]) -> List[bool]:
+    """
+    Run one verification function across a batch of values.
+
+    Resolves the function once and applies it with map(), so the
+    per-value overhead is a single C-level call instead of a registry
+    lookup per item.
+
+    Args:
+        name: Name of verification function
+        values: Iterable of strings to verify
+
+    Returns:
+        List of results, one per value, in input order
+
+    Raises:
+        KeyError: If no verification function is registered under name
+    """
+    func = _VERIFICATION_REGISTRY.get(name)
+    if func is None:
+        raise KeyError(f"Unknown verification function: {name}")
+    return list(map(func, values))
+
+
+def luhn_batch(values: Iterable[str]) -> List[bool]:
+    """
+    Run the Luhn check across a batch of values.
+
+    Convenience wrapper over the map()-driven batch path for the most
+    common bulk verification, avoiding the per-call registry lookup.
+
+    Args:
+        values: Iterable of strings to verify
+
+    Returns:
+        List of results, one per value, in input order
+    """
+    return list(map(luhn, values))
 
 
 def register_verification_function(name: str, func: Callable[[str], bool]) -> None:
@@ -2049,8 +2148,10 @@ def register_verification_function(name: str, func: Callable[[str], bool]) -> No
 
         register_verification_function("custom", custom_verify)
     """
-    VERIFICATION_FUNCTIONS[name] = func
-    logger.info(f"Registered verification function: {name}")
+    # Intern the key so later lookups hit the identity fast path in the
+    # dict probe, matching the compiler-interned built-in keys.
+    _VERIFICATION_REGISTRY[sys.intern(name)] = func
+    logger.info("Registered verification function: %s", name)
 
 
 def unregister_verification_function(name: str) -> bool:
@@ -2063,8 +2164,8 @@ def unregister_verification_function(name: str) -> bool:
     Returns:
         True if function was removed, False if not found
     """
-    if name in VERIFICATION_FUNCTIONS:
-        del VERIFICATION_FUNCTIONS[name]
-        logger.info(f"Unregistered verification function: {name}")
+    if name in _VERIFICATION_REGISTRY:
+        del _VERIFICATION_REGISTRY[name]
+        logger.info("Unregistered verification function: %s", name)
         return True
     return False
\ No newline at end of file